@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import argparse
+import fnmatch
 import json
+import os
+import re
 import shutil
 import zipfile
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 
 EXPECTED_RUN_NAMES = {
@@ -14,6 +17,7 @@ EXPECTED_RUN_NAMES = {
     "math_hard_grpo",
     "math_hard_reinforce",
 }
+CHECKPOINT_DIR_PATTERN = re.compile(fnmatch.translate("step_*"))
 
 
 def _parse_args() -> argparse.Namespace:
@@ -70,19 +74,38 @@ def _find_latest_checkpoint_dir(run_dir: Path) -> Path:
         except Exception as e:
             raise ValueError(f"Unexpected checkpoint directory name: {path.name}") from e
 
-    candidates = [path for path in ckpt_root.glob("step_*") if path.is_dir()]
+    with os.scandir(ckpt_root) as entries:
+        candidates = [
+            Path(entry.path)
+            for entry in entries
+            if CHECKPOINT_DIR_PATTERN.match(entry.name) and entry.is_dir(follow_symlinks=False)
+        ]
     if not candidates:
         raise FileNotFoundError(f"No step_* checkpoint directories found under {ckpt_root}")
     return max(candidates, key=_step_num)
 
 
+def _scandir_recursive(path: str) -> Iterator[os.DirEntry]:
+    # DirEntry caches the file type from readdir, so no extra stat per entry.
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_symlink():
+                continue
+            if entry.is_file(follow_symlinks=False):
+                yield entry
+            elif entry.is_dir(follow_symlinks=False):
+                yield from _scandir_recursive(entry.path)
+
+
 def _write_zip_from_dir(source_dir: Path, zip_path: Path) -> None:
     with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
-        for path in sorted(source_dir.rglob("*")):
-            if not path.is_file():
-                continue
-            arcname = Path(source_dir.name) / path.relative_to(source_dir)
-            zf.write(path, arcname=str(arcname))
+        base = str(source_dir)
+        entries = sorted(
+            (f"{source_dir.name}/{os.path.relpath(entry.path, base).replace(os.sep, '/')}", entry.path)
+            for entry in _scandir_recursive(base)
+        )
+        for arcname, path in entries:
+            zf.write(path, arcname=arcname)
 
 
 def build_bundle(run_dirs: list[Path], output_dir: Path, overwrite: bool) -> Path:
@@ -5,6 +5,7 @@ import json
 import time
 import gc
 import math
+import stat
 from pathlib import Path
 from typing import Any, Dict, List
 
@@ -365,9 +366,10 @@ def save_checkpoint(
     adapter_files = []
     adapter_total_bytes = 0
     for path in sorted(adapter_dir.rglob("*")):
-        if not path.is_file():
+        st = path.stat()
+        if not stat.S_ISREG(st.st_mode):
             continue
-        size_bytes = int(path.stat().st_size)
+        size_bytes = int(st.st_size)
         adapter_total_bytes += size_bytes
         adapter_files.append(
             {